@@ -1,9 +1,34 @@
 from flask import Flask, request, jsonify
-import subprocess
+from functools import lru_cache
 import os
+import re
+
+from lexer import run_lexer
+from syntax_parser import run_parser
 
 app = Flask(__name__)
 
+# /fix heuristics: a line calling printf whose last non-blank character isn't ';',
+# and the first doubled semicolon
+_PRINTF_NOSEMI = re.compile(r'^(?=[^\n]*printf\()[^\n]*[^;\s][^\S\n]*$', re.M)
+_DOUBLE_SEMI = re.compile(r';;')
+# Every line boundary str.splitlines() recognizes, so line numbers agree with it
+_LINE_BREAK = re.compile('\r\n|[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
+def compile_pipeline(code):
+    """Run the lexer and parser on `code` and return the structured errors."""
+    logged = []
+    tokens = run_lexer(code, logged)
+    run_parser(tokens, logged)
+    return [{"type": "Error", "message": e["message"], "line": e["line"]} for e in logged]
+
+# Results are pure functions of the submitted code, so identical resubmissions
+# are served from memory. The same dicts are returned on every hit, so callers
+# must not mutate the result.
+@lru_cache(maxsize=512)
+def _compile_cached(code):
+    return tuple(compile_pipeline(code))
+
 @app.route('/')
 def home():
     return jsonify({"message": "Adaptive Compiler Backend Running Successfully!"})
@@ -17,40 +42,9 @@ def run_compiler():
     if not code.strip():
         return jsonify({"error": "No C code provided."}), 400
 
-    # Write the code to test_code.c
-    with open("test_code.c", "w") as f:
-        f.write(code)
-
-    # Run the main compiler pipeline
+    # Run the compiler pipeline in-process
     try:
-        result = subprocess.run(
-            ["python3", "main.py"],
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(__file__) or None
-        )
-
-        # read error log and convert to structured errors
-        errors = []
-        error_log_path = os.path.join(os.path.dirname(__file__), "error_log.txt")
-        if os.path.exists(error_log_path):
-            with open(error_log_path, "r") as ef:
-                for line in ef:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    # expect: Line N: message
-                    if line.lower().startswith("line"):
-                        parts = line.split(":", 1)
-                        if len(parts) == 2:
-                            left, msg = parts
-                            try:
-                                line_no = int(left.strip().split()[1])
-                            except Exception:
-                                line_no = None
-                            errors.append({"type": "Error", "message": msg.strip(), "line": line_no})
-                    else:
-                        errors.append({"type": "Info", "message": line})
+        errors = _compile_cached(code)
 
         response = {
             "status": "success" if not errors else "error",
@@ -64,13 +58,21 @@ def run_compiler():
         return jsonify({"error": str(e)}), 500
 
 
-@app.route('/fix', methods=['POST'])
-def suggest_fixes():
-    data = request.get_json() or {}
-    code = data.get("code", "")
+def _line_at(code, pos):
+    """Return the 1-based line number and text of the line containing `pos`.
+
+    `code` must already have its line breaks normalized to '\n'.
+    """
+    start = code.rfind("\n", 0, pos) + 1
+    end = code.find("\n", pos)
+    if end == -1:
+        end = len(code)
+    return code.count("\n", 0, start) + 1, code[start:end]
+
+@lru_cache(maxsize=512)
+def _heuristic_fixes(code):
     # Simple heuristics similar to mock server
     fixes = []
-    lines = code.splitlines()
 
     # missing stdio include
     if "printf(" in code and "#include <stdio.h>" not in code:
@@ -80,30 +82,43 @@ def suggest_fixes():
             "edit": {"type": "insert", "line": 1, "content": "#include <stdio.h>\n"}
         })
 
+    # search a copy with every line break as '\n' so ^/$ and line counts match
+    # splitlines(); edits still refer to lines, which are unaffected
+    text = _LINE_BREAK.sub("\n", code)
+
     # missing semicolon after printf
-    for i, ln in enumerate(lines):
-        if "printf(" in ln and not ln.strip().endswith(";"):
-            fixes.append({
-                "description": "Add missing semicolon to end of statement",
-                "confidence": 0.95,
-                "edit": {"type": "replace", "line": i+1, "original": ln, "replacement": ln + ";"}
-            })
-            break
+    m = _PRINTF_NOSEMI.search(text)
+    if m:
+        line_no, ln = _line_at(text, m.start())
+        fixes.append({
+            "description": "Add missing semicolon to end of statement",
+            "confidence": 0.95,
+            "edit": {"type": "replace", "line": line_no, "original": ln, "replacement": ln + ";"}
+        })
 
     # extra semicolons
-    for i, ln in enumerate(lines):
-        if ";;" in ln:
-            fixes.append({
-                "description": "Remove extra semicolon",
-                "confidence": 0.9,
-                "edit": {"type": "replace", "line": i+1, "original": ln, "replacement": ln.replace(";;", ";", 1)}
-            })
-            break
+    m = _DOUBLE_SEMI.search(text)
+    if m:
+        line_no, ln = _line_at(text, m.start())
+        fixes.append({
+            "description": "Remove extra semicolon",
+            "confidence": 0.9,
+            "edit": {"type": "replace", "line": line_no, "original": ln, "replacement": ln.replace(";;", ";", 1)}
+        })
+
+    return tuple(fixes)
 
-    return jsonify({"fixes": fixes})
+
+@app.route('/fix', methods=['POST'])
+def suggest_fixes():
+    data = request.get_json() or {}
+    code = data.get("code", "")
+    return jsonify({"fixes": _heuristic_fixes(code)})
 
 
 if __name__ == '__main__':
     # ensure backend directory is current working directory
     os.chdir(os.path.dirname(__file__) or '.')
-    app.run(host='127.0.0.1', port=8000, debug=True)
+    # Serve requests concurrently; the pipeline keeps no shared state and the
+    # lru_caches are thread-safe
+    app.run(host='127.0.0.1', port=8000, debug=True, threaded=True)
@@ -1,17 +1,19 @@
 import json
-import os
+from collections import Counter
 
 ERROR_LOG_FILE = "error_history.json"
 
 def load_error_history():
     """Load error history from file."""
-    if not os.path.exists(ERROR_LOG_FILE):
+    try:
+        with open(ERROR_LOG_FILE, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return []
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError:
         return []
-    with open(ERROR_LOG_FILE, "r") as f:
-        try:
-            return json.load(f)
-        except json.JSONDecodeError:
-            return []
 
 def generate_adaptive_analysis():
     """Analyze error history and display adaptive insights."""
@@ -25,17 +27,16 @@ def generate_adaptive_analysis():
     print("\n=== Adaptive Learning Summary ===")
 
     # Count frequency of each unique error
-    message_counts = {}
-    for e in errors:
-        msg = e["message"]
-        message_counts[msg] = message_counts.get(msg, 0) + 1
+    message_counts = Counter(e["message"] for e in errors)
 
-    for msg, count in message_counts.items():
+    # Most frequent errors are reported first
+    for msg, count in message_counts.most_common():
         if count > 3:
             print(f"[Frequent Error] '{msg}' occurred {count} times.")
-            if "semicolon" in msg.lower():
+            msg_lower = msg.lower()
+            if "semicolon" in msg_lower:
                 print("  → Suggested Auto-Fix: Add a missing ';' at the end of the statement.")
-            elif "brace" in msg.lower():
+            elif "brace" in msg_lower:
                 print("  → Suggested Auto-Fix: Fix suggestion for: Unmatched '}'")
         else:
             print(f"[New Error] '{msg}' detected {count} time(s).")
@@ -1,26 +1,23 @@
-import os
+import io
 
 ERROR_LOG_FILE = "error_log.txt"
 
-def log_error(line, message):
-    with open(ERROR_LOG_FILE, "a") as file:
-        file.write(f"Line {line}: {message}\n")
+def log_error(errors, line, message):
+    errors.append({"line": line, "message": message})
 
-def show_errors():
-    if not os.path.exists(ERROR_LOG_FILE):
-        print("No error log found.")
-        return
-
-    with open(ERROR_LOG_FILE, "r") as file:
-        errors = file.readlines()
+def flush_errors(errors, path=ERROR_LOG_FILE):
+    """Write the collected errors to the log file with a single write."""
+    buffer = io.StringIO()
+    for err in errors:
+        buffer.write(f"Line {err['line']}: {err['message']}\n")
+    with open(path, "w") as file:
+        file.write(buffer.getvalue())
 
+def show_errors(errors):
     if errors:
         for err in errors:
-            print(err.strip())
+            print(f"Line {err['line']}: {err['message']}")
         print("\n[Adaptive Suggestion]")
         print("Try checking syntax near the indicated line(s). Each statement should end with a semicolon, and braces must match.")
     else:
         print("No errors recorded yet. Clean run!")
-
-def clear_error_log():
-    open(ERROR_LOG_FILE, "w").close()
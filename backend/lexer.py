@@ -1,41 +1,53 @@
+import os
 import re
+import sys
+
+from error_handler import log_error
+
+_KEYWORDS = frozenset({'int', 'float', 'if', 'else', 'for', 'while', 'return', 'printf'})
+
+# Every alternative starts with a distinct set of characters (MISMATCH aside), so
+# the order below only affects speed: the most frequent kinds are tried first.
+# Keywords are matched as NAME and told apart from identifiers with a set lookup.
+_TOKEN_SPEC = [
+    ('SKIP', r'[ \t]+'),
+    ('NAME', r'\b[a-zA-Z_]\w*\b'),
+    ('SEPARATOR', r'[(){},;]'),
+    ('NEWLINE', r'\r\n|\r|\n'),
+    ('OPERATOR', r'[+\-*/=><]'),
+    ('NUMBER', r'\b\d+\b'),
+    ('STRING', r'"[^"\r\n]*"'),
+    ('MISMATCH', r'.'),
+]
+
+# The token specification is static, so build the master pattern once
+_TOKEN_RE = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in _TOKEN_SPEC))
+_SKIP = {'SKIP', 'NEWLINE'}
+
+# Per-token dumps are only printed when LEXER_DEBUG=1
+DEBUG_LEXER = os.environ.get('LEXER_DEBUG') == '1'
+
+def _scan(code, errors):
+    # Scan the whole source in one pass; line numbers advance on NEWLINE tokens
+    lineno = 1
+    for mo in _TOKEN_RE.finditer(code):
+        kind = mo.lastgroup
+        if kind == 'NEWLINE':
+            lineno += 1
+        elif kind == 'NAME':
+            value = sys.intern(mo.group())
+            yield ('KEYWORD' if value in _KEYWORDS else 'IDENTIFIER', value, lineno)
+        elif kind == 'MISMATCH':
+            log_error(errors, lineno, f"Unexpected token '{mo.group()}'")
+        elif kind not in _SKIP:
+            # interned so the parser can compare values by identity
+            yield (kind, sys.intern(mo.group()), lineno)
+
+def run_lexer(code, errors):
+    tokens = list(_scan(code, errors))
+
+    if DEBUG_LEXER:
+        sys.stdout.write(''.join(f"{tok}\n" for tok in tokens))
+        sys.stdout.flush()
 
-def run_lexer():
-    print("Running Lexer...")
-    try:
-        with open("test_code.c", "r") as file:
-            code = file.readlines()
-    except FileNotFoundError:
-        print("Error: test_code.c not found!")
-        return []
-
-    token_specification = [
-        ('KEYWORD', r'\b(int|float|if|else|for|while|return|printf)\b'),
-        ('IDENTIFIER', r'\b[a-zA-Z_]\w*\b'),
-        ('NUMBER', r'\b\d+\b'),
-        ('OPERATOR', r'[+\-*/=><]'),
-        ('SEPARATOR', r'[(){},;]'),
-        ('STRING', r'"[^"]*"'),
-        ('NEWLINE', r'\n'),
-        ('SKIP', r'[ \t]+'),
-        ('MISMATCH', r'.'),
-    ]
-
-    token_regex = '|'.join(f'(?P<{pair[0]}>{pair[1]})' for pair in token_specification)
-    tokens = []
-
-    for lineno, line in enumerate(code, start=1):
-        for mo in re.finditer(token_regex, line):
-            kind = mo.lastgroup
-            value = mo.group()
-            if kind == 'SKIP' or kind == 'NEWLINE':
-                continue
-            elif kind == 'MISMATCH':
-                from error_handler import log_error
-                log_error(lineno, f"Unexpected token '{value}'")
-            else:
-                tokens.append((kind, value, lineno))
-                print((kind, value, lineno))
-
-    print("Tokenization complete.")
     return tokens
@@ -1,23 +1,47 @@
+import os
+import sys
+
 from lexer import run_lexer
 from syntax_parser import run_parser
-from error_handler import show_errors, clear_error_log
+from error_handler import show_errors, flush_errors, ERROR_LOG_FILE
+
+# Usage: python main.py [source.c]  (defaults to test_code.c)
+# The error log is written next to the source file.
+source_path = sys.argv[1] if len(sys.argv) > 1 else "test_code.c"
+log_path = os.path.join(os.path.dirname(source_path), ERROR_LOG_FILE)
 
 print("Adaptive Error Recovery Compiler Starting...\n")
 
-# Reset previous logs
-clear_error_log()
-print("\n[System] Cleared old error log for fresh analysis.\n")
+# Errors are collected in memory for this run
+errors = []
 
 print("All core modules found.\n")
 
 # === Run Lexer ===
 print("=== Running Lexer ===")
-tokens = run_lexer()
+print("Running Lexer...")
+try:
+    with open(source_path, "r") as file:
+        code = file.read()
+except FileNotFoundError:
+    print(f"Error: {source_path} not found!")
+    code = None
+    tokens = []
+else:
+    tokens = run_lexer(code, errors)
+    print("Tokenization complete.")
 
 # === Run Parser ===
 print("\n=== Running Parser ===")
-run_parser(tokens)
+print("Running Parser...")
+if not tokens:
+    print("No tokens to parse.")
+elif not run_parser(tokens, errors):
+    print("Parsing complete.")
+# Nothing to log if the source couldn't be read (its directory may not exist)
+if code is not None:
+    flush_errors(errors, log_path)
 
 # === Display Errors ===
 print("\n=== Displaying Logged Errors ===")
-show_errors()
+show_errors(errors)
@@ -9,26 +9,42 @@ This server runs clang with resource limits and returns JSON diagnostics.
 """
 from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
-import subprocess
+import asyncio
+import contextlib
+import hashlib
 import tempfile
+import threading
 import json
 import os
 import shutil
 import sys
 import time
 import resource
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+from cachetools import TTLCache
+import ijson
 
 app = FastAPI()
 
 class CodePayload(BaseModel):
     code: str
 
+# Responses are pure functions of the submitted code; keep recent ones keyed by
+# a digest of the source so resubmitting unchanged code skips clang entirely.
+_response_cache = TTLCache(maxsize=1024, ttl=3600)
+_response_cache_lock = threading.Lock()
+
+def _cache_key(endpoint: str, code: str) -> Tuple[str, str]:
+    return endpoint, hashlib.blake2b(code.encode('utf-8'), digest_size=16).hexdigest()
+
+# PATH doesn't change while the server runs, so look clang up once
+_CLANG_PATH = shutil.which('clang') or shutil.which('clang-14') or shutil.which('clang-13')
+
 # Helper to set resource limits for child process
-def _limit_resources():
+def _limit_resources(cpu_seconds: int = 2):
     try:
-        # 2 seconds CPU time
-        resource.setrlimit(resource.RLIMIT_CPU, (2, 2))
+        # 2 seconds CPU time per source by default
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
     except Exception:
         # not all platforms support setting RLIMIT_CPU from Python or the OS may restrict it
         pass
@@ -40,37 +56,258 @@ def _limit_resources():
         # ignore failures to set address-space limits (platform dependent)
         pass
 
-# Try to run clang/clang++ for diagnostics
-def run_clang_diagnostics(source_path: str) -> Dict[str, Any]:
-    clang = shutil.which('clang') or shutil.which('clang-14') or shutil.which('clang-13')
-    if not clang:
-        raise FileNotFoundError('clang not found on PATH')
+# Write the submitted sources; called from a worker thread so disk I/O doesn't block the event loop.
+# Returns the exception for each source that couldn't be written (None if it was)
+# so one bad request doesn't fail the rest of its batch.
+def _write_sources(paths: List[str], sources: List[str]) -> List[Optional[Exception]]:
+    failures = []
+    for path, code in zip(paths, sources):
+        try:
+            with open(path, 'w') as f:
+                f.write(code)
+        except Exception as exc:
+            # e.g. UnicodeEncodeError for a lone surrogate in the payload
+            failures.append(exc)
+        else:
+            failures.append(None)
+    return failures
+
+# Parse clang's stderr into {'diagnostics': [...]} or {'raw': text}
+_JSON_DECODER = json.JSONDecoder()
+
+def _parse_clang_output(text: str) -> Dict[str, Any]:
+    # Decode the JSON object(s) starting at the first '{'. raw_decode stops at
+    # the end of each object, so the rest of the text is never rescanned. Only
+    # objects carrying a 'diagnostics' key count: in text output a '{' is
+    # usually part of an echoed source line such as `int main() {}`.
+    diags = []
+    found = False
+    start = text.find('{')
+    while start != -1:
+        try:
+            obj, end = _JSON_DECODER.raw_decode(text, start)
+        except (ValueError, RecursionError):
+            # not JSON, or nested too deeply to decode (e.g. an echoed `{{{...`)
+            start = text.find('{', start + 1)
+            continue
+        if isinstance(obj, dict) and 'diagnostics' in obj:
+            diags.extend(obj['diagnostics'])
+            found = True
+        start = text.find('{', end)
+    if found:
+        return {'diagnostics': diags}
+    # otherwise return raw text for heuristics
+    return {'raw': text}
+
+# Async file-like wrapper around clang's stderr that keeps a copy of what is
+# read until the output is known to be JSON, so non-JSON output can still be
+# returned as text
+class _RecordingReader:
+    def __init__(self, stream: asyncio.StreamReader):
+        self._stream = stream
+        self.chunks: List[bytes] = []
+        self.recording = True
+        self.nbytes = 0
+
+    async def read(self, n: int = -1) -> bytes:
+        # read(-1) on a StreamReader would wait for EOF; read(0) must stay a
+        # zero-byte read since ijson uses it to probe the stream type
+        chunk = await self._stream.read(n if n >= 0 else 65536)
+        self.nbytes += len(chunk)
+        if self.recording:
+            self.chunks.append(chunk)
+        return chunk
+
+    def stop_recording(self) -> None:
+        self.recording = False
+        self.chunks.clear()
+
+# Stream-parse clang's JSON diagnostics as they are written instead of
+# buffering the whole of stderr first. Output that isn't (only) JSON comes back
+# as {'raw': text}; _run_clang_batch hands each file's share of it to
+# _parse_clang_output.
+async def _read_clang_output(stream: asyncio.StreamReader) -> Dict[str, Any]:
+    reader = _RecordingReader(stream)
+    diags = []
+    try:
+        async for d in ijson.items_async(reader, 'diagnostics.item', multiple_values=True, use_float=True):
+            if reader.recording:
+                # the output is JSON, so the text fallback won't be needed
+                reader.stop_recording()
+            diags.append(d)
+    except (ijson.JSONError, ValueError, RecursionError):
+        if not reader.recording:
+            # malformed after valid diagnostics: keep what was parsed
+            await stream.read()
+            return {'diagnostics': diags}
+        # not (only) JSON: read the rest and fall back to text parsing
+        reader.chunks.append(await stream.read())
+    else:
+        if reader.nbytes:
+            return {'diagnostics': diags}
+    return {'raw': b''.join(reader.chunks).decode('utf-8', errors='replace')}
+
+async def _collect_clang(proc) -> Dict[str, Any]:
+    result = await _read_clang_output(proc.stderr)
+    await proc.wait()
+    return result
+
+# Split the output of one clang run over several files back into per-file results.
+# Output located outside the batch's files (e.g. a note in a system header) belongs
+# to the file of the closest preceding attributed diagnostic. Anything before the
+# first one (such as a driver error) can't be attributed; the second return value
+# reports it so the caller can give each file its own run instead.
+def _split_clang_result(result: Dict[str, Any], paths: List[str]) -> Tuple[List[Dict[str, Any]], bool]:
+    if len(paths) == 1:
+        return [result], False
+
+    unattributed = False
+    if 'diagnostics' in result:
+        index = {p: i for i, p in enumerate(paths)}
+        per_file = [[] for _ in paths]
+        current = None
+        for d in result['diagnostics']:
+            loc = d.get('location', {})
+            name = loc.get('file') if isinstance(loc, dict) else None
+            if name in index:
+                current = index[name]
+            if current is not None:
+                per_file[current].append(d)
+            else:
+                unattributed = True
+        return [{'diagnostics': diags} for diags in per_file], unattributed
+
+    per_file = [[] for _ in paths]
+    current = None
+    for line in result['raw'].splitlines(keepends=True):
+        located = line[len('In file included from '):] if line.startswith('In file included from ') else line
+        for i, p in enumerate(paths):
+            if located.startswith(p + ':'):
+                current = i
+                break
+        if current is not None:
+            per_file[current].append(line)
+        elif line.strip():
+            unattributed = True
+    return [{'raw': ''.join(lines)} for lines in per_file], unattributed
+
+# Wall-clock limit for a single source. clang compiles a batch's files one after
+# another, so a multi-file run gets a much shorter budget: if it runs over, each
+# source is re-run on its own instead of making its neighbours wait on it.
+_CLANG_TIMEOUT = 4
+_BATCH_TIMEOUT = 1
+
+def _timeout_result() -> Dict[str, Any]:
+    return {'timeout': True, 'output': ''}
+
+# Run clang over already-written files and return one result per file, or None if
+# a multi-file run timed out, was killed (e.g. by RLIMIT_CPU) or produced output
+# that can't be attributed to one of its files
+async def _run_clang(paths: List[str]) -> Optional[List[Dict[str, Any]]]:
+    timeout = _CLANG_TIMEOUT if len(paths) == 1 else _BATCH_TIMEOUT
 
     # Use JSON diagnostics if supported
-    cmd = [clang, '-fsyntax-only', '-fno-color-diagnostics', '-fdiagnostics-format=json', source_path]
+    cmd = [_CLANG_PATH, '-fsyntax-only', '-fno-color-diagnostics', '-fdiagnostics-format=json', *paths]
+    # clang writes diagnostics to stderr; -fsyntax-only produces no stdout
+    proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE, preexec_fn=_limit_resources)
     try:
-        res = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False, preexec_fn=_limit_resources, timeout=4)
-    except subprocess.TimeoutExpired:
-        return {'timeout': True, 'output': ''}
+        result = await asyncio.wait_for(_collect_clang(proc), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None
+    if len(paths) > 1 and proc.returncode < 0:
+        return None
+    per_file, unattributed = _split_clang_result(result, paths)
+    if unattributed:
+        return None
+    return per_file
+
+# Run clang once over a batch of sources and return one result per source; a
+# source that couldn't be written or whose output couldn't be parsed gets its
+# exception instead of a result
+async def _run_clang_batch(sources: List[str]) -> List[Any]:
+    if _CLANG_PATH is None:
+        raise FileNotFoundError('clang not found on PATH')
+
+    # Each source gets its own randomly named directory so no request can
+    # #include a neighbour's file, and clang reports every path unambiguously
+    with contextlib.ExitStack() as stack:
+        paths = [os.path.join(stack.enter_context(tempfile.TemporaryDirectory()), 'main.c') for _ in sources]
+        loop = asyncio.get_running_loop()
+        results: List[Any] = await loop.run_in_executor(None, _write_sources, paths, sources)
+        pending = [i for i, exc in enumerate(results) if exc is None]
+        if not pending:
+            return results
+
+        outcome = await _run_clang([paths[i] for i in pending])
+        if outcome is None and len(pending) > 1:
+            # the batch failed as a whole: give each source its own run so one slow
+            # or broken file can't take its neighbours' diagnostics down with it
+            singles = await asyncio.gather(*(_run_clang([paths[i]]) for i in pending), return_exceptions=True)
+            outcome = [r if isinstance(r, Exception) else r[0] if r is not None else _timeout_result() for r in singles]
+        elif outcome is None:
+            outcome = [_timeout_result()]
 
-    # clang writes diagnostics to stderr
-    text = res.stderr.decode('utf-8', errors='replace')
+        for i, result in zip(pending, outcome):
+            results[i] = result
+        # Parse each file's text output separately, off the event loop since echoed
+        # source can make it slow, so input that breaks the parser only fails the
+        # request it came from
+        raw = [i for i in pending if isinstance(results[i], dict) and 'raw' in results[i]]
+        parsed = await asyncio.gather(*(loop.run_in_executor(None, _parse_clang_output, results[i]['raw']) for i in raw), return_exceptions=True)
+        for i, result in zip(raw, parsed):
+            results[i] = result
+    return results
 
+# Requests arriving within _BATCH_WINDOW seconds of each other share one clang
+# invocation (up to _BATCH_MAX sources), amortizing clang's startup cost. Each
+# request then also waits for its neighbours to compile, so batches stay small;
+# BACKEND_BATCH_MAX=1 turns batching off.
+_BATCH_WINDOW = 0.02
+_BATCH_MAX = max(1, int(os.environ.get('BACKEND_BATCH_MAX', 4)))
+_batch_queue = None
+_batch_task = None
+_batch_runs = set()
+
+async def _complete_batch(batch: List[Tuple[asyncio.Future, str]]) -> None:
     try:
-        data = json.loads(text)
-        return {'diagnostics': data.get('diagnostics', [])}
-    except Exception:
-        # fallback: try to extract JSON object inside text
-        start = text.find('{')
-        end = text.rfind('}')
-        if start != -1 and end != -1 and end > start:
-            try:
-                obj = json.loads(text[start:end+1])
-                return {'diagnostics': obj.get('diagnostics', [])}
-            except Exception:
-                pass
-        # otherwise return raw text for heuristics
-        return {'raw': text}
+        results = await _run_clang_batch([code for _fut, code in batch])
+    except Exception as exc:
+        for fut, _code in batch:
+            if not fut.done():
+                fut.set_exception(exc)
+        return
+    for (fut, _code), result in zip(batch, results):
+        if fut.done():
+            continue
+        if isinstance(result, Exception):
+            fut.set_exception(result)
+        else:
+            fut.set_result(result)
+
+async def _batch_worker(queue: asyncio.Queue) -> None:
+    while True:
+        batch = [await queue.get()]
+        await asyncio.sleep(_BATCH_WINDOW)
+        while len(batch) < _BATCH_MAX and not queue.empty():
+            batch.append(queue.get_nowait())
+        # run the batch in the background so the next window starts filling now
+        task = asyncio.create_task(_complete_batch(batch))
+        _batch_runs.add(task)
+        task.add_done_callback(_batch_runs.discard)
+
+# Try to run clang/clang++ for diagnostics
+async def run_clang_diagnostics(code: str) -> Dict[str, Any]:
+    global _batch_queue, _batch_task
+    if _CLANG_PATH is None:
+        raise FileNotFoundError('clang not found on PATH')
+    if _batch_task is None:
+        _batch_queue = asyncio.Queue()
+        _batch_task = asyncio.create_task(_batch_worker(_batch_queue))
+    fut = asyncio.get_running_loop().create_future()
+    await _batch_queue.put((fut, code))
+    return await fut
 
 # Map clang diagnostics to our schema
 def map_clang_diags(diags: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -88,13 +325,14 @@ def map_clang_diags(diags: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 def generate_fixes_from_clang(code: str, diagnostics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     fixes = []
     lines = code.splitlines()
+    has_stdio = '#include <stdio.h>' in code
 
     for d in diagnostics:
         msg = d.get('message', '').lower()
         # missing include for printf (implicit declaration)
         if 'implicit declaration of function' in msg or "printf" in msg and 'undeclared' in msg:
             # suggest adding stdio include if not present
-            if not any('#include <stdio.h>' in l for l in lines):
+            if not has_stdio:
                 fixes.append({
                     'description': 'Add #include <stdio.h> at top',
                     'confidence': 0.95,
@@ -107,14 +345,14 @@ def generate_fixes_from_clang(code: str, diagnostics: List[Dict[str, Any]]) -> L
             if not ln:
                 # fallback: find a line with printf not ending in semicolon
                 for i,l in enumerate(lines):
-                    if 'printf(' in l and not l.strip().endswith(';'):
+                    if 'printf(' in l and not l.rstrip().endswith(';'):
                         fixes.append({'description': 'Add missing semicolon', 'confidence': 0.9, 'edit': {'type': 'replace', 'line': i+1, 'original': l, 'replacement': l + ';'}})
                         break
             else:
                 idx = ln-1
                 if 0 <= idx < len(lines):
                     l = lines[idx]
-                    if not l.strip().endswith(';'):
+                    if not l.rstrip().endswith(';'):
                         fixes.append({'description': 'Add missing semicolon', 'confidence': 0.9, 'edit': {'type': 'replace', 'line': ln, 'original': l, 'replacement': l + ';'}})
         # extra semicolons
         if 'extra' in msg or 'semicolon' in msg and 'unexpected' in msg:
@@ -132,12 +370,14 @@ def generate_fallback_fixes(code: str, errors: List[Dict[str, Any]]) -> List[Dic
     # reuse simple heuristics from previous mock implementation
     fixes = []
     lines = code.splitlines()
+    has_printf = 'printf(' in code
+    has_stdio = '#include <stdio.h>' in code
     # detect printf without stdio
-    if any('printf(' in l for l in lines) and not any('#include <stdio.h>' in l for l in lines):
+    if has_printf and not has_stdio:
         fixes.append({'description': 'Add #include <stdio.h> at top', 'confidence': 0.9, 'edit': {'type': 'insert', 'line': 1, 'content': '#include <stdio.h>\n'}})
     # missing semicolon
     for i,l in enumerate(lines):
-        if 'printf(' in l and not l.strip().endswith(';'):
+        if 'printf(' in l and not l.rstrip().endswith(';'):
             fixes.append({'description': 'Add missing semicolon', 'confidence': 0.9, 'edit': {'type': 'replace', 'line': i+1, 'original': l, 'replacement': l + ';'}})
             break
     # extra semicolon
@@ -147,86 +387,102 @@ def generate_fallback_fixes(code: str, errors: List[Dict[str, Any]]) -> List[Dic
             break
     return fixes
 
-@app.post('/compile')
-async def compile_code(payload: CodePayload):
-    # write code to temporary file
-    with tempfile.TemporaryDirectory() as tmpdir:
-        src_path = os.path.join(tmpdir, 'main.c')
-        with open(src_path, 'w') as f:
-            f.write(payload.code)
+async def _cached_response(endpoint: str, code: str, build) -> Dict[str, Any]:
+    key = _cache_key(endpoint, code)
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+    if cached is not None:
+        return cached
+    response, cacheable = await build(code)
+    if cacheable:
+        with _response_cache_lock:
+            _response_cache[key] = response
+    return response
 
-        try:
-            result = run_clang_diagnostics(src_path)
-        except FileNotFoundError:
-            # clang not available — fallback to heuristics
-            errors = []
-            # reuse simple heuristics
-            if 'printf(' in payload.code and '#include <stdio.h>' not in payload.code:
-                errors.append({'type': 'ReferenceError', 'message': 'printf may be undeclared (missing #include <stdio.h>)'})
-            if payload.code.count('{') != payload.code.count('}'):
-                errors.append({'type': 'SyntaxError', 'message': 'Unmatched braces'})
-            # extra semicolon
-            if ';;' in payload.code:
-                # find line
-                for i,l in enumerate(payload.code.splitlines()):
-                    if ';;' in l:
-                        errors.append({'type':'SyntaxWarning','message':'Extra semicolon detected','line':i+1})
-                        break
-            fixes = generate_fallback_fixes(payload.code, errors)
-            if errors:
-                return {'status':'error','message':'Compilation failed (heuristic)','tokens':[], 'errors': errors, 'fixes': fixes}
-            else:
-                return {'status':'success','message':'Compilation OK (heuristic)','tokens':[], 'errors':[], 'fixes': []}
-
-        # if clang returned raw text
-        if 'raw' in result:
-            raw = result['raw']
-            # basic parse for known patterns
-            errors = []
-            if 'implicit declaration of function' in raw or 'undeclared' in raw and 'printf' in raw:
-                errors.append({'type':'ReferenceError','message':'printf may be undeclared (missing #include <stdio.h>)'})
-            if 'error' in raw or 'warning' in raw:
-                # capture lines with 'error' occurrences
-                errors.append({'type':'Error','message': raw[:200]})
-            fixes = generate_fallback_fixes(payload.code, errors)
-            if errors:
-                return {'status':'error','message':'Compilation failed','tokens':[], 'errors': errors, 'fixes': fixes}
-            else:
-                return {'status':'success','message':'Compilation OK','tokens':[], 'errors':[], 'fixes': []}
+# Each builder returns (response, cacheable); clang timeouts depend on load, so
+# those responses are not cached.
+async def _compile(code: str) -> Tuple[Dict[str, Any], bool]:
+    try:
+        result = await run_clang_diagnostics(code)
+    except FileNotFoundError:
+        # clang not available — fallback to heuristics
+        errors = []
+        # reuse simple heuristics
+        if 'printf(' in code and '#include <stdio.h>' not in code:
+            errors.append({'type': 'ReferenceError', 'message': 'printf may be undeclared (missing #include <stdio.h>)'})
+        if code.count('{') != code.count('}'):
+            errors.append({'type': 'SyntaxError', 'message': 'Unmatched braces'})
+        # extra semicolon
+        if ';;' in code:
+            # find line
+            for i,l in enumerate(code.splitlines()):
+                if ';;' in l:
+                    errors.append({'type':'SyntaxWarning','message':'Extra semicolon detected','line':i+1})
+                    break
+        fixes = generate_fallback_fixes(code, errors)
+        if errors:
+            return {'status':'error','message':'Compilation failed (heuristic)','tokens':[], 'errors': errors, 'fixes': fixes}, True
+        else:
+            return {'status':'success','message':'Compilation OK (heuristic)','tokens':[], 'errors':[], 'fixes': []}, True
 
-        diags = result.get('diagnostics', [])
-        mapped = map_clang_diags(diags)
-        fixes = generate_fixes_from_clang(payload.code, diags)
-        if mapped:
-            return {'status':'error','message':'Compilation failed','tokens':[], 'errors': mapped, 'fixes': fixes}
+    # if clang returned raw text
+    if 'raw' in result:
+        raw = result['raw']
+        # basic parse for known patterns
+        errors = []
+        if 'implicit declaration of function' in raw or 'undeclared' in raw and 'printf' in raw:
+            errors.append({'type':'ReferenceError','message':'printf may be undeclared (missing #include <stdio.h>)'})
+        if 'error' in raw or 'warning' in raw:
+            # capture lines with 'error' occurrences
+            errors.append({'type':'Error','message': raw[:200]})
+        fixes = generate_fallback_fixes(code, errors)
+        if errors:
+            return {'status':'error','message':'Compilation failed','tokens':[], 'errors': errors, 'fixes': fixes}, True
         else:
-            return {'status':'success','message':'Compilation succeeded','tokens':[], 'errors':[], 'fixes': []}
+            return {'status':'success','message':'Compilation OK','tokens':[], 'errors':[], 'fixes': []}, True
 
-@app.post('/fix')
-async def fix_code(payload: CodePayload):
+    diags = result.get('diagnostics', [])
+    mapped = map_clang_diags(diags)
+    fixes = generate_fixes_from_clang(code, diags)
+    cacheable = not result.get('timeout')
+    if mapped:
+        return {'status':'error','message':'Compilation failed','tokens':[], 'errors': mapped, 'fixes': fixes}, cacheable
+    else:
+        return {'status':'success','message':'Compilation succeeded','tokens':[], 'errors':[], 'fixes': []}, cacheable
+
+async def _fix(code: str) -> Tuple[Dict[str, Any], bool]:
     # run clang diagnostics and produce fixes
-    with tempfile.TemporaryDirectory() as tmpdir:
-        src_path = os.path.join(tmpdir, 'main.c')
-        with open(src_path, 'w') as f:
-            f.write(payload.code)
-        try:
-            result = run_clang_diagnostics(src_path)
-        except FileNotFoundError:
-            fixes = generate_fallback_fixes(payload.code, [])
-            return {'fixes': fixes}
+    try:
+        result = await run_clang_diagnostics(code)
+    except FileNotFoundError:
+        fixes = generate_fallback_fixes(code, [])
+        return {'fixes': fixes}, True
 
-        if 'raw' in result:
-            fixes = generate_fallback_fixes(payload.code, [])
-            return {'fixes': fixes}
+    if 'raw' in result:
+        fixes = generate_fallback_fixes(code, [])
+        return {'fixes': fixes}, True
 
-        diags = result.get('diagnostics', [])
-        fixes = generate_fixes_from_clang(payload.code, diags)
-        return {'fixes': fixes}
+    diags = result.get('diagnostics', [])
+    fixes = generate_fixes_from_clang(code, diags)
+    return {'fixes': fixes}, not result.get('timeout')
+
+@app.post('/compile')
+async def compile_code(payload: CodePayload):
+    return await _cached_response('compile', payload.code, _compile)
+
+@app.post('/fix')
+async def fix_code(payload: CodePayload):
+    return await _cached_response('fix', payload.code, _fix)
 
 if __name__ == '__main__':
     # Run uvicorn if executed directly
     import uvicorn
     port = int(os.environ.get('BACKEND_PORT', '8000'))
-    # When run as a script the package name 'backend' may not be importable;
-    # pass the app object directly to uvicorn to avoid ModuleNotFoundError.
-    uvicorn.run(app, host='127.0.0.1', port=port, reload=False)
+    # One worker process per CPU by default so CPU-bound work (JSON parsing,
+    # fix generation) isn't serialized behind a single GIL. Each worker keeps
+    # its own response cache.
+    workers = int(os.environ.get('BACKEND_WORKERS', os.cpu_count() or 4))
+    # Multiple workers need the app as an import string. The package name
+    # 'backend' may not be importable when run as a script, but this file's
+    # directory is on sys.path (and is passed on to the workers), so 'server' is.
+    uvicorn.run('server:app', host='127.0.0.1', port=port, reload=False, workers=workers)
@@ -1,49 +1,52 @@
+import sys
+from collections import deque
+
 from error_handler import log_error
 
-def run_parser(tokens):
-    print("Running Parser...")
+# Token values from run_lexer are interned, so they can be matched by identity
+_EQ = sys.intern('=')
+_PRINTF = sys.intern('printf')
+_LBRACE = sys.intern('{')
+_RBRACE = sys.intern('}')
+_SEMI = sys.intern(';')
+
+def run_parser(tokens, errors):
+    """Check `tokens` for syntax errors; return True if any were logged."""
     if not tokens:
-        print("No tokens to parse.")
-        return
+        return False
 
     errors_found = False
+    n = len(tokens)
+    # lines of currently open braces
+    stack = deque()
+
+    # Single pass over the tokens checking both rules
+    for i, (token_type, token_value, line) in enumerate(tokens):
+        # Rule 1: Check for missing semicolon after assignments or printf
+        if token_value is _EQ:
+            # Look for a semicolon after 2 tokens
+            if i + 2 < n and tokens[i + 2][1] is not _SEMI:
+                log_error(errors, line, "Missing semicolon after assignment.")
+                errors_found = True
 
-    # Rule 1: Check for missing semicolon after assignments or printf
-    for i in range(len(tokens) - 1):
-        token_type, token_value, line = tokens[i]
-        next_token = tokens[i + 1]
+        elif token_value is _PRINTF:
+            if i + 3 < n and tokens[i + 3][1] is not _SEMI:
+                log_error(errors, line, "Missing semicolon after printf statement.")
+                errors_found = True
 
-        if token_value == '=':
-            # Look for a semicolon after 2 tokens
-            if i + 2 < len(tokens):
-                future = tokens[i + 2]
-                if future[1] != ';':
-                    log_error(line, "Missing semicolon after assignment.")
-                    errors_found = True
-
-        if token_value == 'printf':
-            if i + 3 < len(tokens):
-                end_tok = tokens[i + 3]
-                if end_tok[1] != ';':
-                    log_error(line, "Missing semicolon after printf statement.")
-                    errors_found = True
-
-    # Rule 2: Check for unmatched braces
-    stack = []
-    for token_type, token_value, line in tokens:
-        if token_value == '{':
+        # Rule 2: Check for unmatched braces
+        elif token_value is _LBRACE:
             stack.append(line)
-        elif token_value == '}':
+        elif token_value is _RBRACE:
             if stack:
                 stack.pop()
             else:
-                log_error(line, "Unmatched closing brace.")
+                log_error(errors, line, "Unmatched closing brace.")
                 errors_found = True
 
     if stack:
         for line in stack:
-            log_error(line, "Missing closing brace for '{'.")
+            log_error(errors, line, "Missing closing brace for '{'.")
         errors_found = True
 
-    if not errors_found:
-        print("Parsing complete.")
+    return errors_found